@@ -0,0 +1,64 @@
+"""
+JSON helpers shared by the client and CLI formatting code.
+
+Decoding prefers msgspec, then orjson, then the stdlib; encoding
+prefers orjson, then the stdlib. Both accelerators ship via the
+``speed`` extra, and the stdlib path keeps the default install
+dependency-free. On the nested dict/list payloads the API returns, the
+C decoders are several times faster than stdlib json.
+"""
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec.json as _msgspec_json
+except ImportError:
+    _msgspec_json = None
+
+# orjson walks dataclass fields in C, so callers holding dataclass
+# instances can skip the recursive asdict() copy before dumping.
+SERIALIZES_DATACLASSES = orjson is not None
+
+
+def _default(obj: Any) -> Any:
+    """Serializer for objects the encoder doesn't handle natively."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+if _msgspec_json is not None:
+    # A reused Decoder skips per-call setup.
+    _decoder = _msgspec_json.Decoder()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return _decoder.decode(data)
+
+elif orjson is not None:
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+else:
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+if orjson is not None:
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        # orjson only supports two-space indentation, which is the only
+        # indentation this package uses.
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=_default, option=option).decode()
+
+else:
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        return json.dumps(obj, indent=indent, default=_default)
@@ -0,0 +1,72 @@
+"""
+Numeric kernels for observation value arrays.
+
+When numba is installed (the ``speed`` extra) the kernels are JIT
+compiled to tight loops over contiguous float64 buffers, with
+``cache=True`` so the compile cost is paid once per machine. Without
+numba they fall back to vectorized numpy, which is still far faster
+than looping over record objects in Python.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _rolling_mean_impl(x, window):
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    acc = 0.0
+    for i in range(n):
+        acc += x[i]
+        if i >= window:
+            acc -= x[i - window]
+        if i >= window - 1:
+            out[i] = acc / window
+    return out
+
+
+def _pct_change_impl(x):
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(1, n):
+        out[i] = x[i] / x[i - 1] - 1.0
+    return out
+
+
+if njit is not None:
+    _rolling_mean_impl = njit(fastmath=True, cache=True)(_rolling_mean_impl)
+    _pct_change_impl = njit(fastmath=True, cache=True)(_pct_change_impl)
+
+
+def rolling_mean(values, window: int) -> np.ndarray:
+    """
+    Trailing moving average over a value sequence.
+
+    The first window-1 entries are NaN. Returns a float64 array.
+    """
+    if window < 1:
+        raise ValueError(f"window must be >= 1, got {window}")
+    x = np.ascontiguousarray(values, dtype=np.float64)
+    if njit is not None:
+        return _rolling_mean_impl(x, window)
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] >= window:
+        csum = np.concatenate(([0.0], np.cumsum(x)))
+        out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
+def pct_change(values) -> np.ndarray:
+    """
+    Period-over-period fractional change. The first entry is NaN.
+    """
+    x = np.ascontiguousarray(values, dtype=np.float64)
+    if njit is not None:
+        return _pct_change_impl(x)
+    out = np.full(x.shape[0], np.nan)
+    if x.shape[0] > 1:
+        out[1:] = x[1:] / x[:-1] - 1.0
+    return out
@@ -1,9 +1,10 @@
 import sys
 import click
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union, Optional
 
 from .client import ApiKeyNotSetError, JSTDataClient, InvalidApiKeyError
-from .utils import common_params, common_search_params, format_and_print
+from .utils import common_params, common_search_params, date_handler, format_and_print
 
 client = JSTDataClient()
 
@@ -24,6 +25,21 @@ def resolve_id(value: str, search_func) -> str:
         pass
     return value
 
+
+def resolve_ids(lookups: List[tuple]) -> List[str]:
+    """
+    Resolve many (value, search_func) lookups, fanning out over threads.
+
+    Each lookup is an independent HTTP round trip; overlapping them on
+    the client's pooled session makes multi-keyword queries pay roughly
+    one round trip of latency instead of N. Results come back in input
+    order.
+    """
+    if len(lookups) <= 1:
+        return [resolve_id(value, func) for value, func in lookups]
+    with ThreadPoolExecutor(max_workers=min(16, len(lookups))) as executor:
+        return list(executor.map(lambda args: resolve_id(*args), lookups))
+
 @click.group()
 def cli():
     """
@@ -194,8 +210,8 @@ def search_series(query, limit, offset, format):
 @click.option("--entity", multiple=True, help="Entity ID(s) or keywords")
 @click.option("--series", multiple=True, help="Series ID(s) or keywords")
 @click.option("--frequency", type=click.Choice(["Annual", "Quarterly", "Monthly", "Daily", "Intraday"]))
-@click.option("--start-date", help="Start date (YYYY-MM-DD)")
-@click.option("--end-date", help="End date (YYYY-MM-DD)")
+@click.option("--start-date", help="Start date (YYYY, YYYY-MM, or YYYY-MM-DD)")
+@click.option("--end-date", help="End date (YYYY, YYYY-MM, or YYYY-MM-DD)")
 @click.option("--start-time", help="Start time (unix timestamp)")
 @click.option("--end-time", help="End time (unix timestamp)")
 @click.option("--fuzzy", is_flag=True, default=True, help="Try to resolve keywords to IDs automatically")
@@ -204,14 +220,25 @@ def query(metric, entity, series, frequency, start_date, end_date, start_time, e
     """
     The unified query engine. Mix and match metrics, entities, and series.
     """
+    try:
+        start_date = date_handler(start_date) if start_date else None
+        end_date = date_handler(end_date) if end_date else None
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
     m_ids = list(metric)
     e_ids = list(entity)
     s_ids = list(series)
 
     if fuzzy:
-        m_ids = [resolve_id(m, client.search_metrics) for m in m_ids]
-        e_ids = [resolve_id(e, client.search_entities) for e in e_ids]
-        s_ids = [resolve_id(s, client.search_series) for s in s_ids]
+        resolved = resolve_ids(
+            [(m, client.search_metrics) for m in m_ids]
+            + [(e, client.search_entities) for e in e_ids]
+            + [(s, client.search_series) for s in s_ids]
+        )
+        m_ids = resolved[: len(m_ids)]
+        e_ids = resolved[len(m_ids) : len(m_ids) + len(e_ids)]
+        s_ids = resolved[len(m_ids) + len(e_ids) :]
 
     results = client.query(
         metric=m_ids or None,
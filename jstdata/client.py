@@ -1,13 +1,17 @@
 import hashlib
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlencode
 
-import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from . import _json
 from .models import (
     Entity,
     EntityRelationship,
@@ -22,6 +26,45 @@ APP_DIR = Path.home() / ".jstdata"
 CONFIG_FILE = APP_DIR / "config.json"
 
 
+def _read_body(response: requests.Response) -> bytes:
+    """
+    Read the body of a streamed response in one pass.
+
+    Pulls straight from the underlying urllib3 response (decompressing if
+    needed) instead of going through response.content, which buffers the
+    raw bytes chunk-by-chunk into an intermediate list first.
+    """
+    raw = response.raw
+    if raw is not None:
+        try:
+            return raw.read(decode_content=True)
+        except TypeError:
+            # Raw objects without urllib3's decode_content keyword
+            pass
+    return response.content
+
+
+@lru_cache(maxsize=None)
+def _record_columns(record_type) -> tuple:
+    """Field names for a record dataclass, computed once per type."""
+    return tuple(f.name for f in fields(record_type))
+
+
+@lru_cache(maxsize=None)
+def _record_extractor(record_type):
+    """
+    Compile a record -> tuple extractor specialized to a dataclass.
+
+    Generating `lambda r: (r.a, r.b, ...)` once per type turns each
+    extraction into plain attribute loads, with no per-record fields()
+    reflection or getattr-by-name loop — the same specialization trick
+    dataclasses use for their generated __init__.
+    """
+    columns = _record_columns(record_type)
+    source = f"lambda r: ({', '.join('r.' + name for name in columns)},)"
+    return eval(source, {}), columns
+
+
 class ApiKeyNotSetError(Exception):
     pass
 
@@ -40,8 +83,6 @@ class JSTDataClientConfig:
     base_url: Optional[str] = None
 
     def __post_init__(self):
-        APP_DIR.mkdir(exist_ok=True)
-        
         # 1. Start with defaults
         default_url = "https://api.jeffersonst.io"
         
@@ -77,6 +118,9 @@ class JSTDataClientConfig:
         current["api_key"] = kwargs.get("api_key") or current.get("api_key") or self.api_key
         current["base_url"] = kwargs.get("base_url") or current.get("base_url") or self.base_url
 
+        # Created on demand rather than at construction time, so merely
+        # importing the CLI (which builds a client) touches no state.
+        APP_DIR.mkdir(parents=True, exist_ok=True)
         with open(CONFIG_FILE, "w") as f:
             json.dump(current, f, indent=2)
         
@@ -107,7 +151,7 @@ class JSTDataCache:
         self.params = dict(sorted_items)
 
         self._cache_dir = APP_DIR / "cache"
-        self._cache_dir.mkdir(exist_ok=True)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
 
         json_data = json.dumps(
             {
@@ -122,15 +166,28 @@ class JSTDataCache:
     def read(self):
         if not self._cache_file.exists():
             return None
+        import pandas as pd
+
         return pd.read_parquet(self._cache_file)
 
-    def write(self, df: pd.DataFrame):
+    def write(self, df: "pd.DataFrame"):
         df.to_parquet(self._cache_file)
 
 
 class JSTDataClient:
+    # Pool sizing and retry policy for the shared HTTP session.
+    POOL_SIZE = 32
+    RETRIES = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        validate: bool = False,
     ):
         """
         Initializes the JSTDataClient.
@@ -138,12 +195,41 @@ class JSTDataClient:
         Args:
             api_key: The API key for authenticating with the Jefferson Street REST API.
             base_url: The base URL of the API.
+            validate: When True, verify the key with a lightweight request
+                up front. Off by default so constructing a client costs no
+                network round trip; a bad key surfaces on the first real
+                call instead.
         """
         # Pass non-None values to override defaults/config/env
         kwargs = {}
         if api_key: kwargs["api_key"] = api_key
         if base_url: kwargs["base_url"] = base_url
         self._cfg = JSTDataClientConfig(**kwargs)
+        self._session: Optional[requests.Session] = None
+        if validate and not self.validate_key():
+            raise InvalidApiKeyError("Invalid API key")
+
+    def _get_session(self) -> requests.Session:
+        """
+        Returns the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps connections alive across requests, so
+        repeated calls (e.g. paged listings) skip the TCP/TLS handshake.
+        """
+        if self._session is None:
+            session = self._make_cached_session() or requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.POOL_SIZE,
+                pool_maxsize=self.POOL_SIZE,
+                max_retries=self.RETRIES,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        # validate_key() can temporarily swap the key, so refresh it here
+        # rather than freezing it at session creation time.
+        self._session.params = {"api-key": self.api_key}
+        return self._session
 
     @property
     def api_key(self):
@@ -174,6 +260,38 @@ class JSTDataClient:
         finally:
             self._cfg.api_key = original_key
 
+    @staticmethod
+    def _make_cached_session() -> Optional[requests.Session]:
+        """
+        Build a requests-cache backed session when opted in, else None.
+
+        Every endpoint is a read-only GET keyed entirely by its query
+        parameters, so interactive re-runs of the same command can be
+        answered from a local SQLite cache without a round trip. Opt-in
+        via JSTDATA_HTTP_CACHE=1 and the 'cache' extra; metadata-ish
+        endpoints get a longer TTL than query results.
+        """
+        if not os.environ.get("JSTDATA_HTTP_CACHE"):
+            return None
+        try:
+            from requests_cache import CachedSession
+        except ImportError:
+            return None
+        from datetime import timedelta
+
+        APP_DIR.mkdir(parents=True, exist_ok=True)
+        return CachedSession(
+            cache_name=str(APP_DIR / "http_cache"),
+            backend="sqlite",
+            expire_after=timedelta(hours=1),
+            allowable_methods=("GET",),
+            urls_expire_after={
+                "*/query": timedelta(minutes=5),
+                "*/search/*": timedelta(hours=1),
+                "*": timedelta(hours=24),
+            },
+        )
+
     def make_request(
         self,
         endpoint: str,
@@ -186,7 +304,17 @@ class JSTDataClient:
         if endpoint[0] != "/":
             endpoint = f"/{endpoint}"
 
-        url = f"{self.base_url}{endpoint}"
+        # Encode the query string ourselves: requests' per-call param
+        # merging re-parses and re-joins the URL on every request, which
+        # adds up on hot pagination loops. The api-key stays in
+        # session.params and is merged in during prepare as before.
+        url = f"{self.base_url.rstrip('/')}{endpoint}"
+        if params:
+            query = urlencode(
+                {k: v for k, v in params.items() if v is not None}, doseq=True
+            )
+            if query:
+                url = f"{url}?{query}"
 
         # Caching logic could be more sophisticated, but keeping it simple for now
         if enable_cache:
@@ -195,17 +323,23 @@ class JSTDataClient:
             if cached_df is not None:
                 return {"records": cached_df.to_dict("records")}
 
-        api_key = self.api_key
-        with requests.Session() as session:
-            session.params = {"api-key": api_key}
-            response = session.get(url, params=params)
-
-        if response.status_code == 403:
-            raise InvalidApiKeyError("Invalid API key")
+        session = self._get_session()
+        # stream=True defers the body read, so error statuses short-circuit
+        # below without buffering (or even receiving) the full payload.
+        response = session.get(url, stream=True)
+
+        if not response.ok:
+            # Error paths never read the body; with stream=True that
+            # would strand the pooled connection, so release it first.
+            response.close()
+            if response.status_code == 403:
+                raise InvalidApiKeyError("Invalid API key")
         response.raise_for_status()
 
-        data = response.json()
+        data = _json.loads(_read_body(response))
         if enable_cache and "records" in data:
+            import pandas as pd
+
             cache.write(pd.DataFrame(data["records"]))
 
         return data
@@ -337,7 +471,9 @@ class JSTDataClient:
         end_date: Optional[str] = None,
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
-        order_by: Optional[str] = None
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> List[TimeSeries]:
         """
         Query for observations. This is the main data extraction method.
@@ -351,7 +487,9 @@ class JSTDataClient:
             "end_date": end_date,
             "order_by": order_by,
             "start_time": start_time,
-            "end_time": end_time
+            "end_time": end_time,
+            "limit": limit,
+            "offset": offset,
         }
         # Filter out None values
         params = {k: v for k, v in params.items() if v is not None}
@@ -369,16 +507,32 @@ class JSTDataClient:
         return records
 
 
-    def query_df(self, **kwargs) -> pd.DataFrame:
+    def query_df(self, **kwargs) -> "pd.DataFrame":
         """
         Convenience method that returns the query results as a single flattened pandas DataFrame.
         Excellent for notebook usage.
         """
-        observations = self.query(**kwargs)
-        if not observations:
+        # Imported here (cached after the first call) so CLI commands that
+        # never touch a DataFrame skip pandas' sizeable import cost.
+        import numpy as np
+        import pandas as pd
+
+        results = self.query(**kwargs)
+        if not results:
             return pd.DataFrame()
 
-        df = pd.DataFrame([asdict(o) for o in observations])
-        df["observation_timestamp"] = pd.to_datetime(df["observation_timestamp"])
-        df["release_timestamp"] = pd.to_datetime(df["release_timestamp"])
-        return df
+        # Extract each observation with a tuple extractor compiled once
+        # for the Observation type, then transpose to columns so pandas
+        # adopts each column in one step (struct-of-arrays).
+        extract, columns = _record_extractor(Observation)
+        rows = [extract(o) for ts in results for o in ts.observations]
+        if not rows:
+            return pd.DataFrame()
+        data = dict(zip(columns, zip(*rows)))
+        # Pack values into a typed float64 buffer up front: ~28 bytes per
+        # boxed Python float drops to 8, and pandas adopts the buffer
+        # as-is instead of inferring a dtype from object tuples.
+        data["value"] = np.fromiter(data["value"], dtype=np.float64, count=len(rows))
+        data["observation_timestamp"] = pd.to_datetime(data["observation_timestamp"])
+        data["release_timestamp"] = pd.to_datetime(data["release_timestamp"])
+        return pd.DataFrame(data, copy=False)
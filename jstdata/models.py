@@ -70,7 +70,12 @@ class Series:
         if last_updated is None:
             last_updated = datetime.min
 
-        entities = [Entity.from_dict(e) for e in data.get("entities", [])]
+        # Entities arrive as {id, label} dicts from the series endpoints
+        # but as bare id strings from query records
+        entities = [
+            Entity.from_dict(e) if isinstance(e, dict) else Entity(id=e, label=e)
+            for e in data.get("entities", [])
+        ]
 
         return cls(
             id=data["id"],
@@ -134,18 +139,40 @@ class TimeSeries:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TimeSeries":
+        # Query records identify their series as either 'id' or 'series_id'
+        series_id = data.get("id") or data.get("series_id", "")
         series = {
-            "id": data.get("id", ""),
+            "id": series_id,
             "label": data.get("label", ""),
             "frequency": data.get("frequency", ""),
             "source": data.get("source", ""),
             "units": data.get("units", ""),
             "seasonal_adjustment": data.get("seasonal_adjustment", ""),
-            "last_updated": data.get("last_updated", ""),
+            # None (not "") when absent, so Series.from_dict doesn't try
+            # to parse an empty string as a datetime
+            "last_updated": data.get("last_updated") or None,
             "metric_id": data.get("metric_id", ""),
             "entities": data.get("entities", []),
         }
         return cls(
             series=Series.from_dict(series),
-            observations=[Observation.from_dict(dict(o, series_id=data["id"])) for o in data["observations"]]
+            observations=[Observation.from_dict(dict(o, series_id=series_id)) for o in data["observations"]]
         )
+
+    def values(self) -> "np.ndarray":
+        """Observation values as a contiguous float64 numpy array."""
+        import numpy as np
+
+        return np.array([o.value for o in self.observations], dtype=np.float64)
+
+    def rolling_mean(self, window: int) -> "np.ndarray":
+        """Trailing moving average of the observation values."""
+        from ._kernels import rolling_mean
+
+        return rolling_mean(self.values(), window)
+
+    def pct_change(self) -> "np.ndarray":
+        """Period-over-period fractional change of the observation values."""
+        from ._kernels import pct_change
+
+        return pct_change(self.values())
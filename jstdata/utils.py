@@ -1,60 +1,140 @@
-import json
-from io import StringIO
+import csv
+import sys
+from io import BytesIO
 from dataclasses import is_dataclass, asdict
+from functools import lru_cache
 
 import click
-import pandas as pd
-from tabulate import tabulate
+
+from . import _json
+
+# pandas and tabulate are imported inside the code paths that need them:
+# together they cost a few hundred ms of startup, which every CLI
+# invocation would otherwise pay even for json output or --help.
+
+
+# Shared option decorators, built once at import: every command that
+# uses common_params would otherwise re-allocate and re-introspect the
+# same click.option objects during CLI startup.
+_LIMIT_OPTION = click.option(
+    "--limit",
+    default=100,
+    help="Maximum number of records to return (default: 100)",
+)
+_SEARCH_LIMIT_OPTION = click.option(
+    "--limit",
+    default=5,
+    help="Maximum number of records to return (default: 5)",
+)
+_OFFSET_OPTION = click.option(
+    "--offset", default=0, help="Number of records to skip (default: 0)"
+)
+_FORMAT_OPTION = click.option(
+    "--format",
+    default="pretty",
+    help="Output format. Valid formats are: json, csv, pretty, grid.",
+)
 
 
 def common_params(f):
     """
     Decorator to apply common CLI parameters: limit, offset, and format.
     """
-    f = click.option(
-        "--limit",
-        default=100,
-        help="Maximum number of records to return (default: 100)",
-    )(f)
-    f = click.option(
-        "--offset", default=0, help="Number of records to skip (default: 0)"
-    )(f)
-    f = click.option(
-        "--format",
-        default="pretty",
-        help="Output format. Valid formats are: json, csv, pretty.",
-    )(f)
-    return f
+    return _LIMIT_OPTION(_OFFSET_OPTION(_FORMAT_OPTION(f)))
 
 def common_search_params(f):
     """
     Decorator to apply common CLI parameters: limit, offset, and format.
     Includes different defaults for limit
     """
-    f = click.option(
-        "--limit",
-        default=5,
-        help="Maximum number of records to return (default: 100)",
-    )(f)
-    f = click.option(
-        "--offset", default=0, help="Number of records to skip (default: 0)"
-    )(f)
-    f = click.option(
-        "--format",
-        default="pretty",
-        help="Output format. Valid formats are: json, csv, pretty.",
-    )(f)
-    return f
+    return _SEARCH_LIMIT_OPTION(_OFFSET_OPTION(_FORMAT_OPTION(f)))
+
+
+
+# Dispatch on input length instead of chained prefix checks; each entry
+# pads a partial date out to a full YYYY-MM-DD.
+_DATE_NORMALIZERS = {
+    4: lambda s: f"{s}-01-01",  # YYYY
+    7: lambda s: f"{s}-01",  # YYYY-MM
+    10: lambda s: s,  # YYYY-MM-DD
+}
+
+
+@lru_cache(maxsize=1024)
+def date_handler(date_str: str) -> str:
+    """
+    Normalize a YYYY, YYYY-MM, or YYYY-MM-DD date string to YYYY-MM-DD.
+
+    Memoized, since batch scripts tend to pass the same handful of dates
+    over and over.
+    """
+    try:
+        return _DATE_NORMALIZERS[len(date_str)](date_str)
+    except KeyError:
+        raise ValueError(
+            f"Invalid date {date_str!r}. Expected YYYY, YYYY-MM, or YYYY-MM-DD."
+        ) from None
+
+
+def _fast_pretty(records):
+    """
+    Format a list of flat record dicts as a bordered table.
+
+    Covers the common list-output case without tabulate, whose
+    pure-Python per-cell work dominates CLI wall-clock on large
+    --limit pulls. Records share a schema, so columns come from the
+    first record.
+    """
+    cols = list(records[0].keys())
+    cells = [[str(r.get(c, "")) for c in cols] for r in records]
+    widths = [
+        max(len(c), *(len(row[i]) for row in cells))
+        for i, c in enumerate(cols)
+    ]
+    separator = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
 
+    def fmt_row(row):
+        return "| " + " | ".join(f"{v:<{w}}" for v, w in zip(row, widths)) + " |"
+
+    lines = [separator, fmt_row(cols), separator]
+    lines.extend(fmt_row(row) for row in cells)
+    lines.append(separator)
+    return "\n".join(lines)
+
+
+def _write_csv(records, out):
+    """
+    Stream record dicts to ``out`` as CSV.
+
+    Writes rows as they come instead of materializing a DataFrame first,
+    so the CSV path is O(1) in record count for memory and skips dtype
+    inference entirely.
+    """
+    writer = csv.DictWriter(
+        out,
+        fieldnames=list(records[0].keys()),
+        extrasaction="ignore",
+        lineterminator="\n",
+    )
+    writer.writeheader()
+    writer.writerows(records)
 
 
 def df_to_csv_string(df):
-    csv_buffer = StringIO()
-    df.to_csv(csv_buffer, index=False)
-    return csv_buffer.getvalue()
+    # A bytes buffer keeps pandas on its C csv-writer path rather than
+    # encoding through a Python text wrapper.
+    csv_buffer = BytesIO()
+    df.to_csv(csv_buffer, index=False, lineterminator="\n")
+    return csv_buffer.getvalue().decode()
 
 
 def format_and_print(response_data, format):
+    if format == "json" and _json.SERIALIZES_DATACLASSES:
+        # orjson serializes dataclasses (and datetimes) natively, so the
+        # recursive asdict() copy below would be pure overhead here.
+        click.echo(_json.dumps(response_data, indent=2))
+        return
+
     # Convert dataclasses to dicts if necessary
     if isinstance(response_data, list):
         data = [asdict(r) if is_dataclass(r) else r for r in response_data]
@@ -64,27 +144,26 @@ def format_and_print(response_data, format):
         data = response_data
 
     if format == "json":
-        # Handle datetime serialization in JSON
-        def default_serializer(obj):
-            if hasattr(obj, "isoformat"):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-        
-        click.echo(json.dumps(data, indent=2, default=default_serializer))
+        click.echo(_json.dumps(data, indent=2))
     elif format == "csv":
         if isinstance(data, dict):
             data = [data]
-        click.echo(df_to_csv_string(pd.DataFrame(data)))
-    elif format == "pretty":
         if not data:
             click.echo("No records found.")
             return
-            
+        _write_csv(data, sys.stdout)
+    elif format in ("pretty", "grid"):
+        if not data:
+            click.echo("No records found.")
+            return
+
         if isinstance(data, dict):
             # Single record: vertical table
+            from tabulate import tabulate
+
             table_data = [(k, v) for k, v in data.items()]
             click.echo(
-                tabulate(table_data, headers=["key", "value"], tablefmt="pretty")
+                tabulate(table_data, headers=["key", "value"], tablefmt=format)
             )
             return
             
@@ -99,5 +178,10 @@ def format_and_print(response_data, format):
                 else:
                     flat_item[k] = v
             flattened_data.append(flat_item)
-            
-        click.echo(tabulate(flattened_data, headers="keys", tablefmt="pretty"))
+
+        if format == "grid":
+            from tabulate import tabulate
+
+            click.echo(tabulate(flattened_data, headers="keys", tablefmt="grid"))
+        else:
+            click.echo(_fast_pretty(flattened_data))
@@ -48,6 +48,21 @@ def test_metric_ls(runner, mock_url):
         assert "Gross Domestic Product" in result.output
 
 
+def test_metric_ls_csv(runner, mock_url):
+    """Test 'metric ls --format csv' streams header and rows."""
+    mock_data = {
+        "records": [
+            {"id": "gdp", "name": "Gross Domestic Product"}
+        ]
+    }
+    with requests_mock.Mocker() as m:
+        m.get(f"{mock_url}/metric", json=mock_data)
+        result = runner.invoke(cli, ["metric", "ls", "--format", "csv"])
+        assert result.exit_code == 0
+        assert result.output.startswith("id,name\n")
+        assert "gdp,Gross Domestic Product" in result.output
+
+
 def test_query_direct_id(runner, mock_url):
     """Test 'query' command with direct IDs."""
     mock_query_data = {
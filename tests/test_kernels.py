@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from jstdata._kernels import pct_change, rolling_mean
+
+
+def test_rolling_mean():
+    """Trailing mean with NaN padding for the warm-up window."""
+    out = rolling_mean([1.0, 2.0, 3.0, 4.0], window=2)
+    assert np.isnan(out[0])
+    assert out[1:].tolist() == [1.5, 2.5, 3.5]
+
+
+def test_rolling_mean_invalid_window():
+    """A non-positive window raises ValueError."""
+    with pytest.raises(ValueError):
+        rolling_mean([1.0, 2.0], window=0)
+
+
+def test_pct_change():
+    """Fractional change with NaN for the first entry."""
+    out = pct_change([100.0, 110.0, 99.0])
+    assert np.isnan(out[0])
+    assert out[1] == pytest.approx(0.10)
+    assert out[2] == pytest.approx(-0.10)
@@ -0,0 +1,24 @@
+import pytest
+
+from jstdata.utils import date_handler
+
+
+def test_date_handler_full_date():
+    """Full dates pass through unchanged."""
+    assert date_handler("2024-03-15") == "2024-03-15"
+
+
+def test_date_handler_year():
+    """A bare year expands to January 1st."""
+    assert date_handler("2024") == "2024-01-01"
+
+
+def test_date_handler_year_month():
+    """A year-month expands to the first of the month."""
+    assert date_handler("2024-03") == "2024-03-01"
+
+
+def test_date_handler_invalid():
+    """Unrecognized date shapes raise ValueError."""
+    with pytest.raises(ValueError):
+        date_handler("3/15/2024")